@@ -1,7 +1,8 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+from hub_sdk.base.auth import check_api_key
 from hub_sdk.config import HUB_API_ROOT, HUB_WEB_ROOT
 from hub_sdk.hub_client import HUBClient
 
 __version__ = "0.0.18"
-__all__ = "__version__", "HUBClient", "HUB_API_ROOT", "HUB_WEB_ROOT"
+__all__ = "__version__", "HUBClient", "HUB_API_ROOT", "HUB_WEB_ROOT", "check_api_key"
@@ -42,19 +42,23 @@ class APIClient:
     Attributes:
         base_url (str): The base URL for the API.
         headers (dict, None): Headers to be included in each request.
+        session (requests.Session, None): Session used to send requests, reusing its pooled connections.
         logger (logging.Logger): An instance of the logger for logging purposes.
     """
 
-    def __init__(self, base_url: str, headers: Optional[Dict] = None):
+    def __init__(self, base_url: str, headers: Optional[Dict] = None, session: Optional[requests.Session] = None):
         """
         Initialize an instance of the APIClient class.
 
         Args:
             base_url (str): The base URL for the API.
             headers (dict, optional): Headers to be included in each request.
+            session (requests.Session, optional): Session to send requests with. If None, each request opens its own
+                connection.
         """
         self.base_url = base_url
         self.headers = headers
+        self.session = session
         self.logger = logger
 
     def _make_request(
@@ -99,8 +103,12 @@ class APIClient:
             kwargs["data"] = data
 
         try:
-            response = requests.request(method, url, **kwargs)
+            request = self.session.request if self.session is not None else requests.request
+            response = request(method, url, **kwargs)
 
+            # A 404 to a HEAD request answers an existence check, so it is not an error to log or raise
+            if method == "HEAD" and response.status_code == 404:
+                return None
             response.raise_for_status()
             return response
         except requests.exceptions.RequestException as e:
@@ -128,6 +136,20 @@ class APIClient:
         """
         return self._make_request("GET", endpoint, params=params)
 
+    def head(self, endpoint: str, params: Optional[Dict] = None) -> Optional[requests.Response]:
+        """
+        Make a HEAD request to the API.
+
+        Args:
+            endpoint (str): The endpoint to append to the base URL for the request.
+            params (dict, optional): Query parameters for the request.
+
+        Returns:
+            (Optional[requests.Response]): The response object from the HTTP HEAD request, None if the resource is not
+                found or the request fails.
+        """
+        return self._make_request("HEAD", endpoint, params=params)
+
     def post(
         self,
         endpoint: str,
@@ -3,6 +3,8 @@
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from hub_sdk.config import FIREBASE_AUTH_URL, HUB_API_ROOT, HUB_WEB_ROOT, PREFIX
 from hub_sdk.helpers.error_handler import ErrorHandler
@@ -16,12 +18,32 @@ class Auth:
     Attributes:
         api_key (str, None): The API key used for authentication.
         id_token (str, None): The authentication token.
+        session (requests.Session): HTTP session owned by this client, reusing pooled connections across requests and
+            retrying idempotent requests on connection errors and transient server errors.
     """
 
     def __init__(self):
         """Initializes the Auth class with default authentication settings."""
         self.api_key = None
         self.id_token = None
+        self.session = requests.Session()
+        # Retry idempotent requests that fail to connect or read, or that the server rejects as rate-limited or
+        # temporarily unavailable, backing off between attempts; the last response is returned for normal handling.
+        # Retry-After is not honored, so a server hint cannot stall a call beyond the short backoff
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+            respect_retry_after_header=False,
+        )
+        adapter = HTTPAdapter(max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Closes the client's HTTP session and releases its pooled connections."""
+        self.session.close()
 
     def authenticate(self) -> bool:
         """
@@ -35,7 +57,7 @@ class Auth:
         """
         try:
             if header := self.get_auth_header():
-                r = requests.post(f"{HUB_API_ROOT}/v1/auth", headers=header)
+                r = self.session.post(f"{HUB_API_ROOT}/v1/auth", headers=header)
                 if not r.json().get("success", False):
                     raise ConnectionError("Unable to authenticate.")
                 return True
@@ -95,7 +117,8 @@ class Auth:
         """
         try:
             headers = {"origin": HUB_WEB_ROOT}
-            response = requests.post(FIREBASE_AUTH_URL, json={"email": email, "password": password}, headers=headers)
+            payload = {"email": email, "password": password}
+            response = self.session.post(FIREBASE_AUTH_URL, json=payload, headers=headers)
             if response.status_code == 200:
                 self.id_token = response.json().get("idToken")
                 return True
@@ -107,3 +130,21 @@ class Auth:
             status_code = e.response.status_code if hasattr(e, "response") else None
             error_msg = ErrorHandler(status_code).handle()
             logger.warning(f"{PREFIX} {error_msg}")
+
+
+def check_api_key(api_key: str) -> bool:
+    """
+    Check whether an API key is accepted by the server, without creating a HUBClient.
+
+    Args:
+        api_key (str): The API key to check.
+
+    Returns:
+        (bool): True if the server authenticates the key, False otherwise.
+    """
+    auth = Auth()
+    auth.set_api_key(api_key)
+    try:
+        return auth.authenticate()
+    finally:
+        auth.close()
@@ -18,7 +18,7 @@ class CRUDClient(APIClient):
         logger (logging.Logger): An instance of the logger for logging purposes.
     """
 
-    def __init__(self, base_endpoint, name, headers):
+    def __init__(self, base_endpoint, name, headers, session=None):
         """
         Initialize a CRUDClient instance.
 
@@ -26,8 +26,9 @@ class CRUDClient(APIClient):
             base_endpoint (str): The base endpoint URL for the API.
             name (str): The name associated with the CRUD operations (e.g., "User").
             headers (dict): Headers to be included in API requests.
+            session (requests.Session, optional): Session used to send API requests.
         """
-        super().__init__(f"{HUB_FUNCTIONS_ROOT}/v1/{base_endpoint}", headers)
+        super().__init__(f"{HUB_FUNCTIONS_ROOT}/v1/{base_endpoint}", headers, session)
         self.name = name
         self.logger = logger
 
@@ -61,6 +62,22 @@ class CRUDClient(APIClient):
         except Exception as e:
             self.logger.error(f"Failed to read {self.name} with ID: {id}, {e}")
 
+    def exists(self, id: str) -> bool:
+        """
+        Check whether an entity exists without retrieving its data.
+
+        Args:
+            id (str): The unique identifier of the entity to check.
+
+        Returns:
+            (bool): True if the entity exists, False otherwise.
+        """
+        try:
+            return self.head(f"/{id}") is not None
+        except Exception as e:
+            self.logger.error(f"Failed to check {self.name} with ID: {id}, {e}")
+            return False
+
     def update(self, id: str, data: dict) -> Optional[Response]:
         """
         Update an existing entity using the API.
@@ -12,7 +12,7 @@ from hub_sdk.config import HUB_FUNCTIONS_ROOT
 class PaginatedList(APIClient):
     """Handles pagination for list endpoints on the API while managing retrieval, navigation, and updating of data."""
 
-    def __init__(self, base_endpoint, name, page_size=None, public=None, headers=None):
+    def __init__(self, base_endpoint, name, page_size=None, public=None, headers=None, session=None):
         """
         Initialize a PaginatedList instance.
 
@@ -21,8 +21,9 @@ class PaginatedList(APIClient):
             name (str): A descriptive name for the paginated resource.
             page_size (int, optional): The number of items per page.
             headers (dict, optional): Additional headers to include in API requests.
+            session (requests.Session, optional): Session used to send API requests.
         """
-        super().__init__(f"{HUB_FUNCTIONS_ROOT}/v1/{base_endpoint}", headers)
+        super().__init__(f"{HUB_FUNCTIONS_ROOT}/v1/{base_endpoint}", headers, session)
         self.name = name
         self.page_size = page_size
         self.public = public
@@ -3,8 +3,8 @@
 import os
 import signal
 import sys
+import threading
 from pathlib import Path
-from time import sleep
 from typing import Any, Dict, Optional
 
 from requests import Response
@@ -32,12 +32,13 @@ AGENT_NAME = f"python-{__version__}-colab" if is_colab() else f"python-{__versio
 class ModelUpload(APIClient):
     """Manages uploading and exporting model files and metrics to Ultralytics HUB and heartbeat updates."""
 
-    def __init__(self, headers):
+    def __init__(self, headers, session=None):
         """Initialize ModelUpload with API client configuration."""
-        super().__init__(f"{HUB_API_ROOT}/v1/models", headers)
+        super().__init__(f"{HUB_API_ROOT}/v1/models", headers, session)
         self.name = "model"
         self.alive = True
         self.agent_id = None
+        self._heartbeat_stop = threading.Event()  # Wakes the heartbeat loop as soon as heartbeats are stopped
         self.rate_limits = {"metrics": 3.0, "ckpt": 900.0, "heartbeat": 300.0}
 
     def upload_model(self, id, epoch, weights, is_best=False, map=0.0, final=False):
@@ -143,6 +144,8 @@ class ModelUpload(APIClient):
                     "agent": AGENT_NAME,
                     "agentId": self.agent_id,
                 }
+                # Shares the client's session with the calling thread: its connection pool is thread-safe, and the SDK
+                # never changes session state after construction, passing headers with each request instead
                 res = self.post(endpoint, json=payload).json()
                 new_agent_id = res.get("data", {}).get("agentId")
 
@@ -152,7 +155,7 @@ class ModelUpload(APIClient):
                 if new_agent_id != self.agent_id:
                     self.logger.debug("Agent Id updated.")
                     self.agent_id = new_agent_id
-                sleep(interval)
+                self._heartbeat_stop.wait(interval)
         except Exception as e:
             self.logger.error(f"Failed to start heartbeats: {e}")
             raise e
@@ -162,12 +165,14 @@ class ModelUpload(APIClient):
         Stop the threaded heartbeat loop.
 
         This method stops the threaded loop responsible for sending heartbeats to Ultralytics HUB.
-        It sets the 'alive' flag to False, which will cause the loop in '_start_heartbeats' to exit.
+        It sets the 'alive' flag to False and wakes the loop in '_start_heartbeats', which then exits without waiting
+        out the rest of its interval.
 
         Returns:
             (None): The method does not return a value.
         """
         self.alive = False
+        self._heartbeat_stop.set()
         self.logger.debug("Heartbeats stopped.")
 
     def _register_signal_handlers(self) -> None:
@@ -230,14 +235,15 @@ class ModelUpload(APIClient):
 class ProjectUpload(APIClient):
     """Handle project file uploads to Ultralytics HUB via API requests."""
 
-    def __init__(self, headers: dict):
+    def __init__(self, headers: dict, session=None):
         """
         Initialize the class with the specified headers.
 
         Args:
             headers: The headers to use for API requests.
+            session (requests.Session, optional): Session used to send API requests.
         """
-        super().__init__(f"{HUB_API_ROOT}/v1/projects", headers)
+        super().__init__(f"{HUB_API_ROOT}/v1/projects", headers, session)
         self.name = "project"
 
     def upload_image(self, id: str, file: str) -> Optional[Response]:
@@ -270,14 +276,15 @@ class ProjectUpload(APIClient):
 class DatasetUpload(APIClient):
     """Manages uploading dataset files to Ultralytics HUB via API requests."""
 
-    def __init__(self, headers: dict):
+    def __init__(self, headers: dict, session=None):
         """
         Initialize the class with the specified headers.
 
         Args:
             headers: The headers to use for API requests.
+            session (requests.Session, optional): Session used to send API requests.
         """
-        super().__init__(f"{HUB_API_ROOT}/v1/datasets", headers)
+        super().__init__(f"{HUB_API_ROOT}/v1/datasets", headers, session)
         self.name = "dataset"
 
     def upload_dataset(self, id, file) -> Optional[Response]:
@@ -91,7 +91,7 @@ class HUBClient(Auth):
         Returns:
             (Models): An instance of the Models class.
         """
-        return Models(model_id, self.get_auth_header())
+        return Models(model_id, self.get_auth_header(), session=self.session)
 
     @require_authentication
     def dataset(self, dataset_id: str = None) -> Datasets:
@@ -105,7 +105,7 @@ class HUBClient(Auth):
         Returns:
             (Datasets): An instance of the Datasets class.
         """
-        return Datasets(dataset_id, self.get_auth_header())
+        return Datasets(dataset_id, self.get_auth_header(), session=self.session)
 
     @require_authentication
     def team(self, arg):
@@ -124,7 +124,20 @@ class HUBClient(Auth):
         Returns:
             (Projects): An instance of the Projects class.
         """
-        return Projects(project_id, self.get_auth_header())
+        return Projects(project_id, self.get_auth_header(), session=self.session)
+
+    @require_authentication
+    def project_exists(self, project_id: str) -> bool:
+        """
+        Checks whether a project exists using a HEAD request, without retrieving the project data.
+
+        Args:
+            project_id (str): The identifier of the project.
+
+        Returns:
+            (bool): True if the project exists, False otherwise.
+        """
+        return Projects(headers=self.get_auth_header(), session=self.session).exists(project_id)
 
     @require_authentication
     def user(self, user_id: Optional[str] = None) -> Users:
@@ -138,7 +151,7 @@ class HUBClient(Auth):
         Returns:
             (Users): An instance of the Projects class.
         """
-        return Users(user_id, self.get_auth_header())
+        return Users(user_id, self.get_auth_header(), session=self.session)
 
     @require_authentication
     def model_list(self, page_size: Optional[int] = 10, public: Optional[bool] = None) -> ModelList:
@@ -152,7 +165,7 @@ class HUBClient(Auth):
         Returns:
             (ModelList): An instance of the ModelList class.
         """
-        return ModelList(page_size, public, self.get_auth_header())
+        return ModelList(page_size, public, self.get_auth_header(), session=self.session)
 
     @require_authentication
     def project_list(self, page_size: Optional[int] = 10, public: Optional[bool] = None) -> ProjectList:
@@ -166,7 +179,7 @@ class HUBClient(Auth):
         Returns:
             (ProjectList): An instance of the ProjectList class.
         """
-        return ProjectList(page_size, public, self.get_auth_header())
+        return ProjectList(page_size, public, self.get_auth_header(), session=self.session)
 
     @require_authentication
     def dataset_list(self, page_size: Optional[int] = 10, public: Optional[bool] = None) -> DatasetList:
@@ -180,7 +193,7 @@ class HUBClient(Auth):
         Returns:
             (DatasetList): An instance of the DatasetList class.
         """
-        return DatasetList(page_size, public, self.get_auth_header())
+        return DatasetList(page_size, public, self.get_auth_header(), session=self.session)
 
     @require_authentication
     def team_list(self, page_size=None, public=None):
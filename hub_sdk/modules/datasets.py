@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, Optional
 
-from requests import Response
+from requests import Response, Session
 
 from hub_sdk.base.crud_client import CRUDClient
 from hub_sdk.base.paginated_list import PaginatedList
@@ -24,16 +24,22 @@ class Datasets(CRUDClient):
         The 'data' attribute is used to store dataset data fetched from the API.
     """
 
-    def __init__(self, dataset_id: Optional[str] = None, headers: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        dataset_id: Optional[str] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        session: Optional[Session] = None,
+    ):
         """
         Initialize a Datasets client.
 
         Args:
             dataset_id (str): Unique id of the dataset.
             headers (dict, optional): Headers to include in HTTP requests.
+            session (requests.Session, optional): Session used to send API requests.
         """
-        super().__init__("datasets", "dataset", headers)
-        self.hub_client = DatasetUpload(headers)
+        super().__init__("datasets", "dataset", headers, session)
+        self.hub_client = DatasetUpload(headers, session)
         self.id = dataset_id
         self.data = {}
         if dataset_id:
@@ -144,7 +150,7 @@ class Datasets(CRUDClient):
 class DatasetList(PaginatedList):
     """A class for managing a paginated list of datasets from the Ultralytics Hub API."""
 
-    def __init__(self, page_size=None, public=None, headers=None):
+    def __init__(self, page_size=None, public=None, headers=None, session=None):
         """
         Initialize a Dataset instance.
 
@@ -152,6 +158,7 @@ class DatasetList(PaginatedList):
             page_size (int, optional): The number of items to request per page.
             public (bool, optional): Whether the items should be publicly accessible.
             headers (dict, optional): Headers to be included in API requests.
+            session (requests.Session, optional): Session used to send API requests.
         """
         base_endpoint = "datasets"
-        super().__init__(base_endpoint, "dataset", page_size, public, headers)
+        super().__init__(base_endpoint, "dataset", page_size, public, headers, session)
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, List, Optional
 
-from requests import Response
+from requests import Response, Session
 
 from hub_sdk.base.crud_client import CRUDClient
 from hub_sdk.base.paginated_list import PaginatedList
@@ -27,17 +27,23 @@ class Models(CRUDClient):
         The 'data' attribute is used to store model data fetched from the API.
     """
 
-    def __init__(self, model_id: Optional[str] = None, headers: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        model_id: Optional[str] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        session: Optional[Session] = None,
+    ):
         """
         Initialize a Models instance.
 
         Args:
             model_id (str, optional): The unique identifier of the model.
             headers (dict, optional): Headers to be included in API requests.
+            session (requests.Session, optional): Session used to send API requests.
         """
         self.base_endpoint = "models"
-        super().__init__(self.base_endpoint, "model", headers)
-        self.hub_client = ModelUpload(headers)
+        super().__init__(self.base_endpoint, "model", headers, session)
+        self.hub_client = ModelUpload(headers, session)
         self.id = model_id
         self.data = {}
         self.metrics = None
@@ -370,7 +376,7 @@ class Models(CRUDClient):
 class ModelList(PaginatedList):
     """Provides a paginated list interface for managing and querying models from the Ultralytics HUB API."""
 
-    def __init__(self, page_size=None, public=None, headers=None):
+    def __init__(self, page_size=None, public=None, headers=None, session=None):
         """
         Initialize a ModelList instance.
 
@@ -378,6 +384,7 @@ class ModelList(PaginatedList):
             page_size (int, optional): The number of items to request per page.
             public (bool, optional): Whether the items should be publicly accessible.
             headers (dict, optional): Headers to be included in API requests.
+            session (requests.Session, optional): Session used to send API requests.
         """
         base_endpoint = "models"
-        super().__init__(base_endpoint, "model", page_size, public, headers)
+        super().__init__(base_endpoint, "model", page_size, public, headers, session)
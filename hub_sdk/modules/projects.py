@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, Optional
 
-from requests import Response
+from requests import Response, Session
 
 from hub_sdk.base.crud_client import CRUDClient
 from hub_sdk.base.paginated_list import PaginatedList
@@ -24,16 +24,22 @@ class Projects(CRUDClient):
         The 'data' attribute is used to store project data fetched from the API.
     """
 
-    def __init__(self, project_id: Optional[str] = None, headers: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        project_id: Optional[str] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        session: Optional[Session] = None,
+    ):
         """
         Initialize a Projects object for interacting with project data via CRUD operations.
 
         Args:
             project_id (str, optional): Project ID for retrieving data.
             headers (dict, optional): A dictionary of HTTP headers to be included in API requests.
+            session (requests.Session, optional): Session used to send API requests.
         """
-        super().__init__("projects", "project", headers)
-        self.hub_client = ProjectUpload(headers)
+        super().__init__("projects", "project", headers, session)
+        self.hub_client = ProjectUpload(headers, session)
         self.id = project_id
         self.data = {}
         if project_id:
@@ -135,7 +141,7 @@ class Projects(CRUDClient):
 class ProjectList(PaginatedList):
     """Provides a paginated list interface for querying project resources from the server."""
 
-    def __init__(self, page_size: int = None, public: bool = None, headers: dict = None):
+    def __init__(self, page_size: int = None, public: bool = None, headers: dict = None, session: Session = None):
         """
         Initialize a ProjectList instance.
 
@@ -143,6 +149,7 @@ class ProjectList(PaginatedList):
             page_size (int, optional): The number of items to request per page.
             public (bool, optional): Whether the items should be publicly accessible.
             headers (dict, optional): Headers to be included in API requests.
+            session (requests.Session, optional): Session used to send API requests.
         """
         base_endpoint = "projects"
-        super().__init__(base_endpoint, "project", page_size, public, headers)
+        super().__init__(base_endpoint, "project", page_size, public, headers, session)
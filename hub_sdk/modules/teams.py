@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, Optional
 
-from requests import Response
+from requests import Response, Session
 
 from hub_sdk.base.crud_client import CRUDClient
 from hub_sdk.base.paginated_list import PaginatedList
@@ -22,15 +22,21 @@ class Teams(CRUDClient):
         The 'data' attribute is used to store team data fetched from the API.
     """
 
-    def __init__(self, team_id: Optional[str] = None, headers: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        team_id: Optional[str] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        session: Optional[Session] = None,
+    ):
         """
         Initialize a Teams instance.
 
         Args:
             team_id (str, optional): The unique identifier of the team.
             headers (dict, optional): A dictionary of HTTP headers to be included in API requests.
+            session (requests.Session, optional): Session used to send API requests.
         """
-        super().__init__("teams", "team", headers)
+        super().__init__("teams", "team", headers, session)
         self.id = team_id
         self.data = {}
         if team_id:
@@ -121,7 +127,7 @@ class Teams(CRUDClient):
 class TeamList(PaginatedList):
     """Provides a paginated list interface for managing and retrieving teams via API requests."""
 
-    def __init__(self, page_size=None, public=None, headers=None):
+    def __init__(self, page_size=None, public=None, headers=None, session=None):
         """
         Initialize a TeamList instance.
 
@@ -129,8 +135,9 @@ class TeamList(PaginatedList):
             page_size (int, optional): The number of items to request per page.
             public (bool, optional): Whether the items should be publicly accessible.
             headers (dict, optional): Headers to be included in API requests.
+            session (requests.Session, optional): Session used to send API requests.
         """
         base_endpoint = "datasets"
         if public:
             base_endpoint = f"public/{base_endpoint}"
-        super().__init__(base_endpoint, "team", page_size, headers)
+        super().__init__(base_endpoint, "team", page_size, public, headers, session)
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, Optional
 
-from requests import Response
+from requests import Response, Session
 
 from hub_sdk.base.crud_client import CRUDClient
 
@@ -21,15 +21,21 @@ class Users(CRUDClient):
         The 'data' attribute is used to store user data fetched from the API.
     """
 
-    def __init__(self, user_id: Optional[str] = None, headers: Optional[Dict[str, Any]] = None) -> None:
+    def __init__(
+        self,
+        user_id: Optional[str] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        session: Optional[Session] = None,
+    ) -> None:
         """
         Initialize a Users object for interacting with user data via CRUD operations.
 
         Args:
             user_id (str, optional): The unique identifier of the user.
             headers (dict, optional): A dictionary of HTTP headers to be included in API requests.
+            session (requests.Session, optional): Session used to send API requests.
         """
-        super().__init__("users", "user", headers)
+        super().__init__("users", "user", headers, session)
         self.id = user_id
         self.data = {}
         if user_id:
@@ -1,63 +1,160 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+import logging
+import zipfile
+
 import pytest
 import requests
 
 from hub_sdk import HUBClient
 from tests.features.object_manager import ObjectManager
 from tests.test_data.data import TestData
+from tests.utils.base_class import BaseClass
 
-fixture_scope = None
-client: HUBClient
+_CREATED_IDS = pytest.StashKey[dict]()
 
 
 def pytest_addoption(parser):
     """
     Add a custom command-line option '--fixture_scope'.
 
+    The option sets how long the test client and the feature objects bound to it live: 'session' (the default) shares
+    one authenticated client across all tests, while 'class' or 'function' authenticate a fresh client for each test
+    class or test function.
+
     Usage:
     Run pytest with '--fixture_scope=function' to set the option to 'function'.
     """
-    parser.addoption("--fixture_scope", action="store", default="class")
+    parser.addoption("--fixture_scope", action="store", default="session")
+
+
+def _created_ids(request):
+    """Returns the in-memory mapping from object kind to the ID of the object created for the current test."""
+    return request.node.stash.setdefault(_CREATED_IDS, {})
 
 
 def determine_scope(fixture_name, config):
-    """Determines fixture scope based on configuration."""
-    global fixture_scope
+    """Determines the scope of per-class fixtures based on configuration, narrowing them only for 'function'."""
     fixture_scope = config.getoption("--fixture_scope")
-    return fixture_scope
+    return "class" if fixture_scope == "session" else fixture_scope
+
+
+def client_scope(fixture_name, config):
+    """Determines the scope of the test client and its feature objects, which may live for the whole session."""
+    return config.getoption("--fixture_scope")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def test_logger(request):
+    """
+    Configures the 'tests' logger once per session; module-level loggers in the test modules propagate to it.
+
+    The logger defaults to WARNING so that verbose debug payloads are neither formatted nor written; pass pytest's
+    '--log-level=DEBUG' to record them.
+    """
+    logger = BaseClass._configure_logger(logging.getLogger("tests"))
+    logger.setLevel(request.config.getoption("log_level") or logging.WARNING)
+    return logger
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """Returns the pytest-recording configuration, scrubbing credentials from recorded cassettes."""
+    return {"filter_headers": [("x-api-key", "DUMMY"), ("authorization", "DUMMY")]}
+
+
+@pytest.fixture(scope="session")
+def auth_data():
+    """Returns the authentication section of the test data, shared by all tests in the session."""
+    return TestData().get_auth_data()
+
+
+@pytest.fixture(scope="session")
+def datasets_data():
+    """Returns the datasets section of the test data, shared by all tests in the session."""
+    return TestData().get_datasets_data()
+
+
+@pytest.fixture(scope="session")
+def models_data():
+    """Returns the models section of the test data, shared by all tests in the session."""
+    return TestData().get_models_data()
+
+
+@pytest.fixture(scope="session")
+def projects_data():
+    """Returns the projects section of the test data, shared by all tests in the session."""
+    return TestData().get_projects_data()
+
+
+@pytest.fixture(scope="session")
+def tiny_dataset_file(tmp_path_factory):
+    """Writes a minimal dataset zip once per session and returns its path, keeping dataset uploads to a few bytes."""
+    path = tmp_path_factory.mktemp("datasets") / "tiny_dataset.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("tiny_dataset/data.yaml", "nc: 1\nnames: [a]\n")
+    return str(path)
+
+
+@pytest.fixture(scope=client_scope)
+def authed_client(auth_data):
+    """
+    Fixture providing a HUBClient authenticated with the valid API key.
+
+    By default the client is created once per session (once per worker under pytest-xdist), so the authentication
+    request is not repeated for every test class; '--fixture_scope' narrows it to a class or function.
+
+    Returns:
+        HUBClient: An instance of the HUBClient with initialized credentials.
+    """
+    client = HUBClient({"api_key": auth_data["valid_api_key"]})
+    yield client
+    client.close()
 
 
 @pytest.fixture(scope=determine_scope)
-def setup(request):
+def setup(request, authed_client):
     """
     Fixture to set up the test environment.
 
-    This fixture initializes a test client with valid API key credentials
-    and makes it available to the test cases.
+    This fixture makes the authenticated client, whose lifetime '--fixture_scope' sets, available to the test cases.
 
     Args:
         request (FixtureRequest): The fixture request object.
+        authed_client (HUBClient): The authenticated test client.
 
     Returns:
         HUBClient: An instance of the HUBClient with initialized credentials.
     """
-    global client
+    # Make the HUBClient instance available to the test cases
+    request.cls.client = authed_client
 
-    # Obtain the valid API key
-    api_key = TestData().get_auth_data()["valid_api_key"]
+    # Yield the HUBClient instance to the test cases
+    yield authed_client
 
-    # Set up the credentials with the API key
-    credentials = {"api_key": api_key}
 
-    # Initialize the HUBClient with the provided credentials
-    client = HUBClient(credentials)
+@pytest.fixture(scope=client_scope)
+def object_manager(authed_client):
+    """Returns the ObjectManager bound to the authenticated test client, shared by all feature object fixtures."""
+    return ObjectManager(authed_client)
 
-    # Make the HUBClient instance available to the test cases
-    request.cls.client = client
 
-    # Yield the HUBClient instance to the test cases
-    yield client
+@pytest.fixture(scope=client_scope)
+def dataset_obj(object_manager):
+    """Returns the Dataset feature object bound to the authenticated test client."""
+    return object_manager.get_dataset()
+
+
+@pytest.fixture(scope=client_scope)
+def model_obj(object_manager):
+    """Returns the Model feature object bound to the authenticated test client."""
+    return object_manager.get_model()
+
+
+@pytest.fixture(scope=client_scope)
+def project_obj(object_manager):
+    """Returns the Project feature object bound to the authenticated test client."""
+    return object_manager.get_project()
 
 
 @pytest.fixture(scope="module")
@@ -77,136 +174,142 @@ def data_for_test():
 
 
 @pytest.fixture(scope="function")
-def delete_test_model(request):
+def delete_test_model(request, model_obj):
     """
     Fixture for deleting a test model after test execution.
 
-    This fixture retrieves the test name and associated model_id from the test request to perform the deletion logic
-    using the model_id.
+    This fixture retrieves the model_id stored on the test item to perform the deletion logic using the model_id.
     """
     yield
-    test_name = request.node.name
-    model_id_key = f"model_id_for_{test_name}"
-    model_id = request.config.cache.get(model_id_key, None)
+    model_id = _created_ids(request).get("model")
 
     if model_id is not None:
-        page_object_manager = ObjectManager(client)
-        model_page = page_object_manager.get_model()
-        model_page.delete_model(model_id)
+        model_obj.delete_model(model_id)
 
 
 @pytest.fixture(scope="function")
-def create_test_model(request):
+def create_test_model(request, model_obj, models_data):
     """
     Fixture for creating a test model before test execution.
 
-    This fixture creates a new model using test data and sets the model_id in the cache for subsequent use during the
-    test.
+    This fixture creates a new model using test data and returns its ID. The ID is also stored on the test item, so
+    delete_test_model removes the model after the test.
     """
-    new_model_data = TestData().get_models_data()["new_model_data"]
-    page_object_manager = ObjectManager(client)
-    model_page = page_object_manager.get_model()
+    new_model_data = models_data["new_model_data"]
 
     # Create new model
-    model_id = model_page.create_new_model(new_model_data)
+    model_id = model_obj.create_new_model(new_model_data)
 
-    # Set the model_id in the request.config.cache
-    test_name = request.node.name
-    model_id_key = f"model_id_for_{test_name}"
-    request.config.cache.set(model_id_key, model_id)
-    yield
+    # Store the model_id on the test item for delete_test_model
+    _created_ids(request)["model"] = model_id
+    return model_id
+
+
+@pytest.fixture(scope=determine_scope)
+def create_test_model_class(model_obj, models_data):
+    """
+    Fixture for creating one test model shared by the tests of a class.
+
+    This fixture creates a new model using test data, returns its ID to every test in the class that requests it, and
+    deletes the model after the last of them. Only use it for tests whose changes to the model do not affect each other.
+    With '--fixture_scope=function' each test gets its own model, matching the lifetime of its client.
+    """
+    model_id = model_obj.create_new_model(models_data["new_model_data"])
+    yield model_id
+
+    if model_id:
+        model_obj.delete_model(model_id)
+
+
+@pytest.fixture(scope="function")
+def cache_model_id(request):
+    """Returns a callable that stores the ID of a model created by the current test, so delete_test_model removes it."""
+    created_ids = _created_ids(request)
+
+    def cache(model_id):
+        """Stores the model ID on the test item, or clears it when given None."""
+        created_ids["model"] = model_id
+
+    return cache
 
 
 @pytest.fixture(scope="function")
-def clear_export_model():
+def clear_export_model(auth_data, models_data):
     """Pytest fixture to clear exports of a specific model after test execution."""
     yield
-    model_id = TestData().get_models_data()["valid_model_ID"]
+    model_id = models_data["valid_model_ID"]
     host = TestData().get_api_data()["host"]
     url = f"{host}/qa/model/{model_id}/clear_exports"
 
     payload = {}
-    headers = {"x-api-key": TestData().get_auth_data()["valid_api_key"]}
+    headers = {"x-api-key": auth_data["valid_api_key"]}
     requests.post(url=url, headers=headers, data=payload)
 
 
 @pytest.fixture(scope="function")
-def delete_test_dataset(request):
+def dataset_factory(dataset_obj, datasets_data):
     """
-    Fixture for deleting a test dataset after test execution.
+    Fixture providing a factory that creates test datasets and deletes them after test execution.
 
-    This fixture retrieves the test name and associated dataset_id from the test request to perform the deletion logic
-    using the dataset_id.
+    Calling the factory creates a dataset from the given data, or from the test data's 'new_dataset_data' if omitted,
+    and returns its ID. Every dataset created this way is deleted on teardown, except those a test has already deleted
+    and passed to `dataset_factory.discard`.
     """
-    yield
-    test_name = request.node.name
-    dataset_id_key = f"dataset_id_for_{test_name}"
-    dataset_id = request.config.cache.get(dataset_id_key, None)
+    created = []
 
-    if dataset_id is not None:
-        page_object_manager = ObjectManager(client)
-        dataset_page = page_object_manager.get_dataset()
-        dataset_page.delete_dataset(dataset_id)
+    def _make(data=None):
+        """Creates a dataset and registers its ID for deletion on teardown."""
+        dataset_id = dataset_obj.create_new_dataset(data or datasets_data["new_dataset_data"])
+        if dataset_id:
+            created.append(dataset_id)
+        return dataset_id
 
+    _make.discard = created.remove
+    yield _make
 
-@pytest.fixture(scope="function")
-def create_test_dataset(request):
-    """
-    Fixture for creating a test dataset before test execution.
-
-    This fixture creates a new dataset using test data and sets the dataset_id in the cache for subsequent use during
-    the test.
-    """
-    new_dataset_data = TestData().get_datasets_data()["new_dataset_data"]
-    page_object_manager = ObjectManager(client)
-    dataset_page = page_object_manager.get_dataset()
-
-    # Create new dataset
-    dataset_id = dataset_page.create_new_dataset(new_dataset_data)
-
-    # Set the dataset_id in the request.config.cache
-    test_name = request.node.name
-    dataset_id_key = f"dataset_id_for_{test_name}"
-    request.config.cache.set(dataset_id_key, dataset_id)
-    yield
+    for dataset_id in created:
+        dataset_obj.delete_dataset(dataset_id)
 
 
 @pytest.fixture(scope="function")
-def delete_test_project(request):
+def delete_test_project(request, project_obj):
     """
     Fixture for deleting a test project after test execution.
 
-    This fixture retrieves the test name and associated project_id from the test request to perform the deletion logic
-    using the project_id.
+    This fixture retrieves the project_id stored on the test item to perform the deletion logic using the project_id.
     """
     yield
-    test_name = request.node.name
-    project_id_key = f"project_id_for_{test_name}"
-    project_id = request.config.cache.get(project_id_key, None)
+    project_id = _created_ids(request).get("project")
 
     if project_id is not None:
-        page_object_manager = ObjectManager(client)
-        project_page = page_object_manager.get_project()
-        project_page.delete_project(project_id)
+        project_obj.delete_project(project_id)
 
 
 @pytest.fixture(scope="function")
-def create_test_project(request):
+def create_test_project(request, project_obj, projects_data):
     """
     Fixture for creating a test project before test execution.
 
-    This fixture creates a new project using test data and sets the project_id in the cache for subsequent use during
-    the test.
+    This fixture creates a new project using test data and returns its ID. The ID is also stored on the test item, so
+    delete_test_project removes the project after the test.
     """
-    new_project_data = TestData().get_projects_data()["new_project_data"]
-    page_object_manager = ObjectManager(client)
-    project_page = page_object_manager.get_project()
+    new_project_data = projects_data["new_project_data"]
 
     # Create new project
-    project_id = project_page.create_new_project(new_project_data)
+    project_id = project_obj.create_new_project(new_project_data)
 
-    # Set the project_id in the request.config.cache
-    test_name = request.node.name
-    project_id_key = f"project_id_for_{test_name}"
-    request.config.cache.set(project_id_key, project_id)
-    yield
+    # Store the project_id on the test item for delete_test_project
+    _created_ids(request)["project"] = project_id
+    return project_id
+
+
+@pytest.fixture(scope="function")
+def cache_project_id(request):
+    """Returns a callable that stores the ID of a project created by the current test for delete_test_project."""
+    created_ids = _created_ids(request)
+
+    def cache(project_id):
+        """Stores the project ID on the test item, or clears it when given None."""
+        created_ids["project"] = project_id
+
+    return cache
@@ -39,24 +39,6 @@ class Dataset(BaseClass):
         dataset.create_dataset(data)
         return dataset.id
 
-    def is_dataset_exists(self, dataset_id):
-        """
-        Checks if a dataset with the specified ID exists.
-
-        Args:
-            dataset_id (str): The ID of the dataset.
-
-        Returns:
-            bool: True if the dataset exists, False otherwise.
-        """
-        try:
-            dataset = self.get_dataset_by_id(dataset_id)
-            return bool(dataset.data)
-        except Exception as e:
-            log = self.get_logger()
-            log.error(e)
-            return False
-
     def update_dataset(self, dataset_id, data):
         """
         Updates an existing dataset with the provided data.
@@ -64,10 +46,19 @@ class Dataset(BaseClass):
         Args:
             dataset_id (str): The ID of the dataset to update.
             data (dict): The data to update the dataset.
+
+        Returns:
+            (dict | None): The updated dataset data returned by the server, or None if the response carries none.
         """
         dataset = self.get_dataset_by_id(dataset_id)
         self.delay()
-        dataset.update(data)
+        response = dataset.update(data)
+        if response is None:
+            return None
+        try:
+            return response.json().get("data") or None
+        except ValueError:
+            return None
 
     def get_dataset_name(self, dataset_id):
         """
@@ -87,20 +78,27 @@ class Dataset(BaseClass):
 
         Args:
             dataset_id (str): The ID of the dataset to delete.
+
+        Returns:
+            bool: True if the server accepted the delete request, False otherwise.
         """
         dataset = self.get_dataset_by_id(dataset_id)
         self.delay()
-        dataset.delete(hard=True)
+        response = dataset.delete(hard=True)
+        return response is not None and response.ok
 
-    def list_public_datasets(self):
+    def list_public_datasets(self, page_size=10):
         """
         Retrieves a list of public datasets.
 
+        Args:
+            page_size (int): The number of datasets to retrieve.
+
         Returns:
-            list: A list of public datasets, limited to a page size of 10.
+            list: A list of public datasets, limited to `page_size` entries.
         """
         self.delay()
-        dataset_list = self.client.dataset_list(page_size=10, public=True)
+        dataset_list = self.client.dataset_list(page_size=page_size, public=True)
         return dataset_list.results
 
     def get_dataset_download_link(self, dataset_id):
@@ -124,7 +122,23 @@ class Dataset(BaseClass):
         Args:
             dataset_id (str): The ID of the dataset.
             dataset_file: The file containing the dataset data.
+
+        Returns:
+            Response: The response object from the dataset upload request.
         """
         dataset = self.get_dataset_by_id(dataset_id)
         self.delay()
-        dataset.upload_dataset(file=dataset_file)
+        return dataset.upload_dataset(file=dataset_file)
+
+    @staticmethod
+    def is_dataset_uploaded(response):
+        """
+        Determines if a dataset file was successfully uploaded.
+
+        Args:
+            response: The response object received from the dataset upload request.
+
+        Returns:
+            bool: True if the dataset file was successfully uploaded, False otherwise.
+        """
+        return response is not None and response.status_code == 200
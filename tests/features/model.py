@@ -1,7 +1,11 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+import itertools
 import json
+import threading
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 import requests
 
@@ -20,6 +24,7 @@ class Model(BaseClass):
             client: The client object used for interacting with models.
         """
         self.client = client
+        self._name_cache = {}
 
     def get_model_by_id(self, model_id):
         """
@@ -31,7 +36,6 @@ class Model(BaseClass):
         Returns:
             Model: The model object.
         """
-        self.delay()
         return self.client.model(model_id)
 
     def create_new_model(self, data):
@@ -44,31 +48,11 @@ class Model(BaseClass):
         Returns:
             str: The ID of the newly created model.
         """
-        self.delay()
         model = self.client.model()
         self.delay()
         model.create_model(data)
         return model.id
 
-    def is_model_exists(self, model_id):
-        """
-        Checks if a model with the specified ID exists.
-
-        Args:
-            model_id (str): The ID of the model.
-
-        Returns:
-            bool: True if the model exists, False otherwise.
-        """
-        try:
-            model = self.get_model_by_id(model_id)
-            model_data = model.data
-            return bool(model_data)
-        except Exception as e:
-            log = self.get_logger()
-            log.error(e)
-            return False
-
     def update_model(self, model_id, data):
         """
         Updates an existing model with the provided data.
@@ -76,10 +60,20 @@ class Model(BaseClass):
         Args:
             model_id (str): The ID of the model to update.
             data (dict): The data to update the model.
+
+        Returns:
+            (dict | None): The updated model data returned by the server, or None if the response carries none.
         """
         model = self.get_model_by_id(model_id)
         self.delay()
-        model.update(data)
+        response = model.update(data)
+        self.invalidate_model_name(model_id)
+        if response is None:
+            return None
+        try:
+            return response.json().get("data") or None
+        except ValueError:
+            return None
 
     def get_model_name(self, model_id):
         """
@@ -91,8 +85,20 @@ class Model(BaseClass):
         Returns:
             str: The name of the model.
         """
-        self.delay()
-        return self.client.model(model_id).data["meta"]["name"]
+        if model_id in self._name_cache:
+            return self._name_cache[model_id]
+        name = self.client.model(model_id).data["meta"]["name"]
+        self._name_cache[model_id] = name
+        return name
+
+    def invalidate_model_name(self, model_id):
+        """
+        Drops the cached name of a model so the next lookup fetches it from the server.
+
+        Args:
+            model_id (str): The ID of the model.
+        """
+        self._name_cache.pop(model_id, None)
 
     def delete_model(self, model_id):
         """
@@ -100,20 +106,30 @@ class Model(BaseClass):
 
         Args:
             model_id (str): The ID of the model to delete.
+
+        Returns:
+            bool: True if the server accepted the delete request, False otherwise.
         """
         model = self.get_model_by_id(model_id)
         self.delay()
-        model.delete(hard=True)
+        response = model.delete(hard=True)
+        self.invalidate_model_name(model_id)
+        deleted = response is not None and response.ok
+        if not deleted:
+            self.logger().error(f"Failed to delete model with ID {model_id}")
+        return deleted
 
-    def list_public_models(self):
+    def list_public_models(self, page_size=10):
         """
         Retrieves a list of public models.
 
+        Args:
+            page_size (int): The number of models to retrieve.
+
         Returns:
-            list: A list of public models, limited to a page size of 10.
+            list: A list of public models, limited to `page_size` entries.
         """
-        self.delay()
-        model_list = self.client.model_list(page_size=10, public=True)
+        model_list = self.client.model_list(page_size=page_size, public=True)
         return model_list.results
 
     def upload_model_metrics(self, model_id, data):
@@ -140,14 +156,15 @@ class Model(BaseClass):
         self.delay()
         model.export(format_name)
 
-    @staticmethod
-    def is_model_exported(model_id, format_name):
+    @classmethod
+    def is_model_exported(cls, model_id, format_name, cancel_event=None):
         """
         Checks if a model has been successfully exported in the specified format.
 
         Args:
             model_id (str): The ID of the model.
             format_name (str): The format in which the model was exported.
+            cancel_event (threading.Event, optional): Event that, once set, stops polling immediately.
 
         Returns:
             bool: True if the model has been successfully exported, False otherwise.
@@ -155,29 +172,63 @@ class Model(BaseClass):
         host = TestData().get_api_data()["host"]
         url = f"{host}/get-export"
 
-        payload = json.dumps({"modelId": model_id, "format": format_name})
-        headers = {"x-api-key": TestData().get_auth_data()["valid_api_key"], "Content-Type": "application/json"}
+        payload = {"modelId": model_id, "format": format_name}
+        headers = {"x-api-key": TestData().get_auth_data()["valid_api_key"]}
 
-        backoff_times = [60, 120, 240, 480]  # Exponential backoff waits in seconds
+        backoff_times = [60, 120, 240, 480]  # Exponential backoff waits in seconds, used without a server hint
+        min_wait, max_wait = 2, backoff_times[-1]  # Bounds for server-hinted waits in seconds
+        deadline = time.monotonic() + sum(backoff_times)  # Total polling budget, independent of the number of polls
+        cancel_event = cancel_event or threading.Event()
+        log = cls.logger()
 
-        for wait_time in backoff_times:
-            try:
-                response = requests.post(url=url, headers=headers, data=payload)
-                data = response.json()
+        for attempt in itertools.count():
+            if cancel_event.is_set():
+                log.info("Export check cancelled.")
+                return False
 
-                if data.get("message") == "Export ready!":
+            wait_time = backoff_times[min(attempt, len(backoff_times) - 1)]
+            try:
+                response = requests.post(url=url, headers=headers, json=payload)
+                if response.json().get("message") == "Export ready!":
                     return True
 
-                print(f"Export not ready. Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
-
+                hint = cls._get_retry_hint(response)
+                if hint is not None:
+                    wait_time = min(max(hint, min_wait), max_wait)
             except Exception as e:
-                print(f"Error during export check: {e}")
+                log.error(f"Error during export check: {e}")
 
-            if wait_time == backoff_times[-1]:
-                print("Max retries reached. Export not ready.")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                log.warning("Max wait reached. Export not ready.")
+                return False
 
-        return False
+            wait_time = min(wait_time, remaining)
+            log.info(f"Export not ready. Retrying in {wait_time:.0f} seconds...")
+            cancel_event.wait(wait_time)
+
+    @staticmethod
+    def _get_retry_hint(response):
+        """
+        Extracts the server-suggested wait before the next export status poll.
+
+        Args:
+            response (requests.Response): The export status response.
+
+        Returns:
+            float | None: Seconds to wait from the `Retry-After` header, given as seconds or an HTTP-date, or None if
+                the server gave no hint.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return None
+        try:
+            return float(retry_after)
+        except ValueError:
+            try:
+                return (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return None
 
     def get_model_download_link(self, model_id):
         """
@@ -190,7 +241,6 @@ class Model(BaseClass):
             str: The download link for the model.
         """
         model = self.get_model_by_id(model_id)
-        self.delay()
         return model.get_weights_url("best")
 
     def upload_model_checkpoint(self, model_id, model_checkpoint_file):
@@ -252,5 +302,4 @@ class Model(BaseClass):
         - dict: Metrics associated with the specified model.
         """
         model = self.get_model_by_id(model_id)
-        self.delay()
         return model.get_metrics()
@@ -4,22 +4,48 @@ from tests.features.dataset import Dataset
 from tests.features.model import Model
 from tests.features.project import Project
 
+# Maps each object kind to the feature class that implements it
+_FACTORIES = {"model": Model, "project": Project, "dataset": Dataset}
+
 
 class ObjectManager:
     """Manages instantiation and retrieval of dataset, model, and project objects using a client instance."""
 
+    __slots__ = ("client", "_cache")
+
     def __init__(self, client):
         """Initializes ObjectManager with a client for managing datasets, models, and projects."""
         self.client = client
+        self._cache = {}
+
+    def get(self, kind):
+        """
+        Returns the object of the given kind for the current client instance, creating it on first use.
+
+        Args:
+            kind (str): One of 'model', 'project' or 'dataset'.
+
+        Returns:
+            The Model, Project or Dataset object bound to the client.
+
+        Raises:
+            ValueError: If `kind` is not a known object kind.
+        """
+        obj = self._cache.get(kind)
+        if obj is None:
+            if kind not in _FACTORIES:
+                raise ValueError(f"Unknown object kind '{kind}', expected one of {list(_FACTORIES)}")
+            obj = self._cache[kind] = _FACTORIES[kind](self.client)
+        return obj
 
     def get_model(self):
-        """Instantiates and returns a Model object using the current client instance."""
-        return Model(self.client)
+        """Returns the Model object for the current client instance, creating it on first use."""
+        return self.get("model")
 
     def get_project(self):
-        """Instantiates and returns a Project object using the current client instance."""
-        return Project(self.client)
+        """Returns the Project object for the current client instance, creating it on first use."""
+        return self.get("project")
 
     def get_dataset(self):
-        """Instantiates and returns a Dataset object using the current client instance."""
-        return Dataset(self.client)
+        """Returns the Dataset object for the current client instance, creating it on first use."""
+        return self.get("dataset")
@@ -2,13 +2,19 @@
 
 from tests.utils.base_class import BaseClass
 
+_MISSING = object()  # Sentinel for cache misses, since None is a valid cached value
+
 
 class Project(BaseClass):
     """Manages project operations such as creation, retrieval, updating, and deletion."""
 
+    __slots__ = ("client", "_project_cache", "_public_projects")
+
     def __init__(self, client):
         """Initialize the Project with a specified client object."""
         self.client = client
+        self._project_cache = {}
+        self._public_projects = {}
 
     def get_project_by_id(self, project_id):
         """
@@ -20,8 +26,13 @@ class Project(BaseClass):
         Returns:
             The project object associated with the given project ID.
         """
+        cache = self._project_cache
+        project = cache.get(project_id, _MISSING)
+        if project is not _MISSING:
+            return project
         self.delay()
-        return self.client.project(project_id)
+        project = cache[project_id] = self.client.project(project_id)
+        return project
 
     def create_new_project(self, data):
         """
@@ -33,10 +44,11 @@ class Project(BaseClass):
         Returns:
             str: The ID of the newly created project.
         """
-        self.delay()
         project = self.client.project()
         self.delay()
         project.create_project(data)
+        if project.id:
+            self._project_cache[project.id] = project
         return project.id
 
     def is_project_exists(self, project_id):
@@ -50,11 +62,10 @@ class Project(BaseClass):
             bool: True if the project exists, False otherwise.
         """
         try:
-            project = self.get_project_by_id(project_id)
-            return bool(project.data)
+            self.delay()
+            return self.client.project_exists(project_id)
         except Exception as e:
-            log = self.get_logger()
-            log.error(e)
+            self.logger().error(e)
             return False
 
     def update_project(self, project_id, data):
@@ -68,6 +79,7 @@ class Project(BaseClass):
         project = self.get_project_by_id(project_id)
         self.delay()
         project.update(data)
+        self._project_cache.pop(project_id, None)
 
     def get_project_name(self, project_id):
         """
@@ -81,16 +93,20 @@ class Project(BaseClass):
         """
         return self.get_project_by_id(project_id).data["meta"]["name"]
 
-    def list_public_projects(self):
+    def list_public_projects(self, page_size=10):
         """
         Retrieves a list of public projects.
 
+        Args:
+            page_size (int): The number of projects to retrieve.
+
         Returns:
-            list: A list of public projects, limited to a page size of 10.
+            list: A list of public projects, limited to `page_size` entries, fetched once per Project object.
         """
-        self.delay()
-        project_list = self.client.project_list(page_size=10, public=True)
-        return project_list.results
+        if page_size not in self._public_projects:
+            self.delay()
+            self._public_projects[page_size] = self.client.project_list(page_size=page_size, public=True).results
+        return self._public_projects[page_size]
 
     def delete_project(self, project_id):
         """
@@ -98,7 +114,12 @@ class Project(BaseClass):
 
         Args:
             project_id (str): The ID of the project to delete.
+
+        Returns:
+            bool: True if the server accepted the delete request, False otherwise.
         """
         project = self.get_project_by_id(project_id)
         self.delay()
-        project.delete(hard=True)
+        response = project.delete(hard=True)
+        self._project_cache.pop(project_id, None)
+        return response is not None and response.ok
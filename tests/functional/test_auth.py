@@ -1,59 +1,68 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+import logging
+
 import pytest
 
-from hub_sdk import HUBClient
-from tests.test_data.data import TestData
+from hub_sdk import HUBClient, check_api_key
 from tests.utils.base_class import BaseClass
 
+# Named under 'tests' explicitly: pytest imports this module as 'functional.test_auth', outside that logger's tree
+log = logging.getLogger("tests.functional.test_auth")
+pytestmark = pytest.mark.network
+
 
 class TestAuth(BaseClass):
     """Class for testing user authentication using HUBClient with various credential methods."""
 
     @pytest.mark.smoke
-    def test_auth_001(self):
+    def test_auth_001(self, authed_client):
         """Verify if the user authenticates successfully using an API key."""
-        log = self.get_logger()
-        valid_api_key = TestData().get_auth_data()["valid_api_key"]
-
-        credentials = {"api_key": valid_api_key}
-        log.info("Creating HUBClient instance with provided credentials")
-        client = HUBClient(credentials)
+        # The test client was built from the valid key, so reuse it rather than authenticating again
+        authentication_status = authed_client.authenticated
 
-        authentication_status = client.authenticated
-        log.info(f"Authentication status: {authentication_status}")
+        log.debug("Authentication status: %s", authentication_status)
         assert authentication_status, "Client authentication failed"
 
     @pytest.mark.skip(reason="Feature is not implemented yet")
     @pytest.mark.smoke
-    def test_auth_002(self):
+    def test_auth_002(self, auth_data):
         """Verify if the user authenticates successfully using Email/Password."""
-        log = self.get_logger()
-        email = TestData().get_auth_data()["valid_credentials"]["email"]
-        password = TestData().get_auth_data()["valid_credentials"]["password"]
+        email = auth_data["valid_credentials"]["email"]
+        password = auth_data["valid_credentials"]["password"]
 
-        log.info(f"Using Email: {email}")
+        log.debug("Using Email: %s", email)
         credentials = {"email": email, "password": password}
 
-        log.info("Creating HUBClient instance with provided credentials")
+        log.debug("Creating HUBClient instance with provided credentials")
         client = HUBClient(credentials)
 
         authentication_status = client.authenticated
-        log.info(f"Authentication status: {authentication_status}")
+        log.debug("Authentication status: %s", authentication_status)
         assert authentication_status, "Client authentication failed"
 
     @pytest.mark.smoke
-    def test_auth_003(self):
-        """Verify an error is raised during initialization with an incorrect API key."""
-        log = self.get_logger()
-        invalid_api_key = TestData().get_auth_data()["invalid_api_key"]
+    def test_auth_003(self, auth_data):
+        """Verify the client is not authenticated when initialized with an incorrect API key."""
+        log.debug("Creating HUBClient instance with the invalid API key")
+        client = HUBClient({"api_key": auth_data["invalid_api_key"]})
 
-        log.info(f"Using invalid API key: {invalid_api_key}")
-        credentials = {"api_key": invalid_api_key}
+        try:
+            authentication_status = client.authenticated
+        finally:
+            client.close()
 
-        log.info("Creating HUBClient instance with provided credentials")
-        client = HUBClient(credentials)
-
-        authentication_status = client.authenticated
-        log.info(f"Authentication status: {authentication_status}")
+        log.debug("Authentication status: %s", authentication_status)
         assert not authentication_status, "Authentication succeeded with an invalid API key"
+
+    @pytest.mark.smoke
+    @pytest.mark.parametrize(
+        "key_field, expected", [("valid_api_key", True), ("invalid_api_key", False)], ids=["valid", "invalid"]
+    )
+    def test_auth_004(self, auth_data, key_field, expected):
+        """Verify check_api_key accepts a valid API key and rejects an invalid one without creating a HUBClient."""
+        log.debug("Checking the %s", key_field)
+        key_accepted = check_api_key(auth_data[key_field])
+
+        log.debug("Key accepted: %s", key_accepted)
+        assert key_accepted is expected, f"Expected check_api_key to return {expected} for {key_field}"
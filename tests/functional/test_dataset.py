@@ -1,175 +1,133 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+import logging
+
 import pytest
 
-from tests.features.object_manager import ObjectManager
-from tests.test_data.data import TestData
 from tests.utils.base_class import BaseClass
 
+# Named under 'tests' explicitly: pytest imports this module as 'functional.test_dataset', outside that logger's tree
+log = logging.getLogger("tests.functional.test_dataset")
+pytestmark = pytest.mark.network
+
 
+@pytest.mark.vcr(record_mode="once")
 class TestDataset(BaseClass):
     """Class for testing dataset operations: retrieval, creation, update, deletion, listing, and upload with pytest."""
 
     @pytest.mark.smoke
-    def test_dataset_001(self):
+    def test_dataset_001(self, dataset_obj, datasets_data):
         """Verify successful retrieval of a dataset by ID."""
-        log = self.get_logger()
-        dataset_id = TestData().get_datasets_data()["valid_dataset_ID"]
-        log.info(f"Attempting to retrieve dataset with ID: {dataset_id}")
+        dataset_id = datasets_data["valid_dataset_ID"]
+        log.debug("Attempting to retrieve dataset with ID: %s", dataset_id)
 
-        object_manager = ObjectManager(self.client)
-        dataset_obj = object_manager.get_dataset()
         dataset = dataset_obj.get_dataset_by_id(dataset_id)
 
-        log.info(f"Dataset retrieved successfully. Dataset data: {dataset.data}")
+        log.debug("Dataset retrieved successfully. Dataset data: %s", dataset.data)
 
         assert "id" in dataset.data, "ID information not found in the dataset data"
         assert "meta" in dataset.data, "Meta information not found in the dataset data"
 
     @pytest.mark.smoke
-    def test_dataset_002(self, request, delete_test_dataset):
+    @pytest.mark.xdist_group("mutating")
+    def test_dataset_002(self, dataset_obj, datasets_data, dataset_factory):
         """Verify successful creation of a new dataset."""
-        log = self.get_logger()
-
-        new_dataset_data = TestData().get_datasets_data()["new_dataset_data"]
-        log.info(f"Attempting to create a new dataset with data: {new_dataset_data}")
+        new_dataset_data = datasets_data["new_dataset_data"]
+        log.debug("Attempting to create a new dataset with data: %s", new_dataset_data)
 
-        object_manager = ObjectManager(self.client)
-        dataset_obj = object_manager.get_dataset()
+        # Create new dataset, deleted again by the factory on teardown
+        dataset_id = dataset_factory(new_dataset_data)
 
-        # Create new dataset
-        dataset_id = dataset_obj.create_new_dataset(new_dataset_data)
+        log.debug("New dataset created successfully. Dataset ID: %s", dataset_id)
 
-        log.info(f"New dataset created successfully. Dataset ID: {dataset_id}")
-
-        # Set the dataset_id in the cache with a key that includes the test name
-        test_name = request.node.name
-        dataset_id_key = f"dataset_id_for_test_{test_name}"
-        request.config.cache.set(dataset_id_key, dataset_id)
-
-        log.info(f"Verifying dataset exists with dataset ID: {dataset_id}")
-        assert dataset_obj.is_dataset_exists(dataset_id), f"Dataset not exists with dataset ID: {dataset_id}"
-        log.info(f"Dataset exists with dataset ID: {dataset_id}")
+        # The server only assigns an ID to a dataset it has created
+        assert dataset_id, "Dataset was not created, no dataset ID was returned."
 
     @pytest.mark.smoke
-    def test_dataset_003(self, request, create_test_dataset, delete_test_dataset):
+    @pytest.mark.xdist_group("mutating")
+    def test_dataset_003(self, dataset_obj, datasets_data, dataset_factory):
         """Verify successful update of dataset metadata."""
-        log = self.get_logger()
-
         # Retrieve necessary data
-        test_name = request.node.name
-        dataset_id_key = f"dataset_id_for_{test_name}"
-        dataset_id = request.config.cache.get(dataset_id_key, None)
-        desired_dataset_data = TestData().get_datasets_data()["desired_dataset_data"]
+        dataset_id = dataset_factory()
+        desired_dataset_data = datasets_data["desired_dataset_data"]
         desired_dataset_name = desired_dataset_data["meta"]["name"]
 
-        log.info(
-            f"Attempting to update metadata for dataset with ID {dataset_id}. Desired dataset data: "
-            f"{desired_dataset_data}"
+        log.debug(
+            "Attempting to update metadata for dataset with ID %s. Desired dataset data: %s",
+            dataset_id,
+            desired_dataset_data,
         )
 
-        object_manager = ObjectManager(self.client)
-        dataset_obj = object_manager.get_dataset()
-
         # Update dataset metadata
-        dataset_obj.update_dataset(dataset_id, desired_dataset_data)
+        updated = dataset_obj.update_dataset(dataset_id, desired_dataset_data)
 
-        log.info("Dataset metadata updated successfully.")
+        log.debug("Dataset metadata updated successfully.")
 
-        # Get the updated dataset name
-        updated_dataset_name = dataset_obj.get_dataset_name(dataset_id)
+        # Read the name from the update response, fetching the dataset again only if the server returned no data
+        if updated and "meta" in updated:
+            updated_dataset_name = updated["meta"].get("name")
+        else:
+            updated_dataset_name = dataset_obj.get_dataset_name(dataset_id)
 
-        log.info(f"Updated dataset name: {updated_dataset_name}")
+        log.debug("Updated dataset name: %s", updated_dataset_name)
 
         assert updated_dataset_name == desired_dataset_name, (
             f"Dataset name is not updated as expected. Actual: {updated_dataset_name}, Expected: {desired_dataset_name}"
         )
 
     @pytest.mark.smoke
-    def test_dataset_004(self, request, create_test_dataset):
+    @pytest.mark.xdist_group("mutating")
+    def test_dataset_004(self, dataset_obj, dataset_factory):
         """Verify successful deletion of a dataset."""
-        log = self.get_logger()
-
         # Retrieve necessary data
-        test_name = request.node.name
-        dataset_id_key = f"dataset_id_for_{test_name}"
-        dataset_id = request.config.cache.get(dataset_id_key, None)
-
-        log.info(f"Attempting to delete dataset with ID: {dataset_id}")
+        dataset_id = dataset_factory()
 
-        object_manager = ObjectManager(self.client)
-        dataset_obj = object_manager.get_dataset()
+        log.debug("Attempting to delete dataset with ID: %s", dataset_id)
 
-        # Delete the dataset
-        dataset_obj.delete_dataset(dataset_id)
+        # Delete the dataset, so the factory no longer has to
+        deleted = dataset_obj.delete_dataset(dataset_id)
+        dataset_factory.discard(dataset_id)
 
-        log.info("Dataset deleted successfully.")
+        log.debug("Dataset delete request accepted: %s", deleted)
 
-        # Verify if the dataset no longer exists
-        assert not dataset_obj.is_dataset_exists(dataset_id), (
-            f"Dataset with ID {dataset_id} still exists after deletion."
-        )
+        assert deleted, f"Dataset with ID {dataset_id} was not deleted."
 
     @pytest.mark.smoke
-    def test_dataset_005(self):
+    def test_dataset_005(self, dataset_obj):
         """Verify successful listing of datasets."""
-        log = self.get_logger()
-
-        log.info("Attempting to list public datasets.")
-
-        object_manager = ObjectManager(self.client)
-        dataset_obj = object_manager.get_dataset()
+        log.debug("Attempting to list public datasets.")
 
-        # List public datasets
-        public_dataset_list = dataset_obj.list_public_datasets()
+        # List public datasets, fetching only the one entry the test inspects
+        public_dataset_list = dataset_obj.list_public_datasets(page_size=1)
 
-        log.info(f"Public datasets listed successfully. First dataset information: {public_dataset_list[0]}")
+        log.debug("Public datasets listed successfully. First dataset information: %s", public_dataset_list[0])
 
         assert "id" in public_dataset_list[0], "ID information not found in the dataset data"
         assert "meta" in public_dataset_list[0], "Meta information not found in the dataset data"
 
     @pytest.mark.smoke
-    def test_dataset_006(self):
+    def test_dataset_006(self, dataset_obj, datasets_data):
         """Verify successful retrieval of dataset storage URL."""
-        log = self.get_logger()
+        dataset_id = datasets_data["valid_dataset_ID"]
+        log.debug("Attempting to retrieve the storage URL for dataset with ID: %s", dataset_id)
 
-        log.info("Attempting to retrieve dataset storage URL.")
-
-        object_manager = ObjectManager(self.client)
-        dataset_obj = object_manager.get_dataset()
-
-        dataset_id = TestData().get_datasets_data()["valid_dataset_ID"]
-
-        # Get Dataset storage URL
+        # Get the dataset storage URL
         link = dataset_obj.get_dataset_download_link(dataset_id)
 
-        log.info(f"Dataset storage URL retrieved successfully: {link}")
+        log.debug("Dataset storage URL retrieved: %s", link)
 
-        assert f"{dataset_id}" in link
+        assert dataset_id in link, f"Dataset ID not found in the storage URL: {link}"
 
     @pytest.mark.smoke
-    def test_dataset_007(self, request, create_test_dataset, delete_test_dataset):
+    @pytest.mark.xdist_group("mutating")
+    def test_dataset_007(self, dataset_obj, dataset_factory, tiny_dataset_file):
         """Verify successful upload of a dataset."""
-        log = self.get_logger()
-
-        # Retrieve necessary data
-        test_name = request.node.name
-        dataset_id_key = f"dataset_id_for_{test_name}"
-        dataset_id = request.config.cache.get(dataset_id_key, None)
-        dataset_file = TestData().get_datasets_data()["dataset_file"]
+        dataset_id = dataset_factory()
 
-        log.info(f"Attempting to upload dataset file for dataset with ID {dataset_id}. Dataset file: {dataset_file}")
-
-        object_manager = ObjectManager(self.client)
-        dataset_obj = object_manager.get_dataset()
-
-        # Upload dataset file
-        dataset_obj.upload_dataset_file(dataset_id, dataset_file)
-
-        log.info("Dataset file uploaded successfully.")
-        # Get the dataset storage URL
-        link = dataset_obj.get_dataset_download_link(dataset_id)
+        log.debug("Attempting to upload dataset file %s for dataset with ID %s", tiny_dataset_file, dataset_id)
 
-        log.info(f"Dataset storage URL retrieved: {link}")
+        # Upload dataset file; its response already confirms the upload, so the storage URL is not fetched again
+        response = dataset_obj.upload_dataset_file(dataset_id, tiny_dataset_file)
 
-        assert f"{dataset_id}/{dataset_file.split('/')[-1]}" in link
+        assert dataset_obj.is_dataset_uploaded(response), "Dataset file is not uploaded"
+        log.debug("Dataset file uploaded successfully.")
@@ -1,245 +1,283 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from tests.features.object_manager import ObjectManager
+from tests.features.model import Model
 from tests.test_data.data import TestData
 from tests.utils.base_class import BaseClass
 
+# Named under 'tests' explicitly: pytest imports this module as 'functional.test_model', outside that logger's tree
+log = logging.getLogger("tests.functional.test_model")
+
 
+@pytest.mark.network
 class TestModel(BaseClass):
     """Class for testing model CRUD operations and validating model data and metrics."""
 
     @pytest.mark.smoke
-    def test_model_001(self):
+    def test_model_001(self, model_obj, models_data):
         """Verify successful retrieval of a model by ID."""
-        model_id = TestData().get_models_data()["valid_model_ID"]
-        object_manager = ObjectManager(self.client)
-        model_obj = object_manager.get_model()
+        model_id = models_data["valid_model_ID"]
 
-        log = self.get_logger()
-        log.info(f"Attempting to retrieve model with ID: {model_id}")
+        log.debug("Attempting to retrieve model with ID: %s", model_id)
 
         model = model_obj.get_model_by_id(model_id)
 
-        log.info(f"Model retrieved successfully. Model data: {model.data}")
+        log.debug("Model retrieved successfully. Model data: %s", model.data)
 
         assert "config" in model.data, "Config information not found in the model data"
         assert "dataset" in model.data, "Dataset information not found in the model data"
         assert "project" in model.data, "Project information not found in the model data"
 
     @pytest.mark.smoke
-    def test_model_002(self):
+    def test_model_002(self, project_obj, dataset_obj, projects_data, datasets_data):
         """Verify project and dataset check functionality."""
-        dataset_ID = TestData().get_datasets_data()["valid_dataset_ID"]
-        project_ID = TestData().get_projects_data()["valid_project_ID"]
-        object_manager = ObjectManager(self.client)
-
-        log = self.get_logger()
-        log.info(f"Attempting to retrieve project with ID: {project_ID}")
+        dataset_ID = datasets_data["valid_dataset_ID"]
+        project_ID = projects_data["valid_project_ID"]
 
-        project_obj = object_manager.get_project()
-        project = project_obj.get_project_by_id(project_ID)
+        log.debug("Attempting to retrieve project with ID %s and dataset with ID %s", project_ID, dataset_ID)
 
-        log.info(f"Project retrieved successfully. Project ID: {project.id}")
+        # The two lookups are independent, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            project_future = executor.submit(project_obj.get_project_by_id, project_ID)
+            dataset_future = executor.submit(dataset_obj.get_dataset_by_id, dataset_ID)
+            project, dataset = project_future.result(), dataset_future.result()
 
-        log.info(f"Attempting to retrieve dataset with ID: {dataset_ID}")
+        log.debug("Project and dataset retrieved successfully. Project ID: %s, Dataset ID: %s", project.id, dataset.id)
 
-        dataset_obj = object_manager.get_dataset()
-        dataset = dataset_obj.get_dataset_by_id(dataset_ID)
-
-        log.info(f"Dataset retrieved successfully. Dataset ID: {dataset.id}")
-
-        if None in (project.id, dataset.id):
-            log.error("Project or Dataset ID is None. Assertion failed.")
-            assert False
-        else:
-            log.info("Project and Dataset ID are not None. Assertion passed.")
+        assert project.id is not None, f"Project with ID {project_ID} could not be retrieved"
+        assert dataset.id is not None, f"Dataset with ID {dataset_ID} could not be retrieved"
 
-    @pytest.mark.smoke
-    def test_model_003(self, request, delete_test_model):
+    @pytest.mark.regression
+    @pytest.mark.xdist_group("mutating")
+    def test_model_003(self, model_obj, models_data, cache_model_id, delete_test_model):
         """Verify successful creation of a new model."""
-        new_model_data = TestData().get_models_data()["new_model_data"]
-
-        log = self.get_logger()
-
-        log.info(f"Attempting to create a new model with the following data: {new_model_data}")
+        new_model_data = models_data["new_model_data"]
 
-        object_manager = ObjectManager(self.client)
-        model_obj = object_manager.get_model()
+        log.debug("Attempting to create a new model with the following data: %s", new_model_data)
 
         # Create new model
         model_id = model_obj.create_new_model(new_model_data)
 
-        log.info(f"New model created successfully. Model ID: {model_id}")
+        log.debug("New model created successfully. Model ID: %s", model_id)
 
-        # Set the model_id in the cache with a key that includes the test name
-        test_name = request.node.name
-        model_id_key = f"model_id_for_test_{test_name}"
-        request.config.cache.set(model_id_key, model_id)
+        # Store the model_id so that delete_test_model removes the model after the test
+        cache_model_id(model_id)
 
-        assert model_obj.is_model_exists(model_id), f"Model with ID {model_id} does not exist."
+        # The server only assigns an ID to a model it has created
+        assert model_id, "Model was not created, no model ID was returned."
 
-    @pytest.mark.smoke
-    def test_model_004(self, request, create_test_model, delete_test_model):
+    @pytest.mark.regression
+    @pytest.mark.xdist_group("mutating")
+    def test_model_004(self, model_obj, models_data, create_test_model_class):
         """Verify successful update of model metadata."""
         # Retrieve necessary data
-        test_name = request.node.name
-        model_id_key = f"model_id_for_{test_name}"
-        model_id = request.config.cache.get(model_id_key, None)
-        desired_model_data = TestData().get_models_data()["desired_model_data"]
+        model_id = create_test_model_class
+        desired_model_data = models_data["desired_model_data"]
         desired_model_name = desired_model_data["meta"]["name"]
 
-        log = self.get_logger()
-
-        log.info(
-            f"Attempting to update metadata for model with ID {model_id}. Desired model data: {desired_model_data}"
+        log.debug(
+            "Attempting to update metadata for model with ID %s. Desired model data: %s",
+            model_id,
+            desired_model_data,
         )
 
-        object_manager = ObjectManager(self.client)
-        model_obj = object_manager.get_model()
-
         # Update model metadata
-        model_obj.update_model(model_id, desired_model_data)
+        updated = model_obj.update_model(model_id, desired_model_data)
 
-        log.info("Model metadata updated successfully.")
+        log.debug("Model metadata updated successfully.")
 
-        # Get the updated model name
-        updated_model_name = model_obj.get_model_name(model_id)
+        # Read the name from the update response, fetching the model again only if the server returned no data
+        if updated and "meta" in updated:
+            updated_model_name = updated["meta"].get("name")
+        else:
+            updated_model_name = model_obj.get_model_name(model_id)
 
-        log.info(f"Updated model name: {updated_model_name}")
+        log.debug("Updated model name: %s", updated_model_name)
 
         assert updated_model_name == desired_model_name, (
             f"Model name is not updated as expected. Actual: {updated_model_name}, Expected: {desired_model_name}"
         )
 
-    @pytest.mark.smoke
-    def test_model_005(self, request, create_test_model):
+    @pytest.mark.regression
+    @pytest.mark.xdist_group("mutating")
+    def test_model_005(self, model_obj, create_test_model):
         """Verify successful deletion of a model."""
         # Retrieve necessary data
-        test_name = request.node.name
-        model_id_key = f"model_id_for_{test_name}"
-        model_id = request.config.cache.get(model_id_key, None)
-
-        log = self.get_logger()
+        model_id = create_test_model
 
-        log.info(f"Attempting to delete model with ID: {model_id}")
-
-        object_manager = ObjectManager(self.client)
-        model_obj = object_manager.get_model()
+        log.debug("Attempting to delete model with ID: %s", model_id)
 
         # Delete the model
-        model_obj.delete_model(model_id)
+        deleted = model_obj.delete_model(model_id)
 
-        log.info("Model deleted successfully.")
+        log.debug("Model delete request accepted: %s", deleted)
 
-        # Assert that the model does not exist after deletion
-        assert not model_obj.is_model_exists(model_id), f"Model with ID {model_id} still exists after deletion."
+        assert deleted, f"Model with ID {model_id} was not deleted."
 
     @pytest.mark.smoke
-    def test_model_006(self):
+    def test_model_006(self, model_obj):
         """Verify successful listing of public models."""
-        log = self.get_logger()
-
-        log.info("Attempting to list public models.")
-
-        object_manager = ObjectManager(self.client)
-        model_obj = object_manager.get_model()
+        log.debug("Attempting to list public models.")
 
-        # List public models
-        public_model_list = model_obj.list_public_models()
+        # List public models, fetching only the one entry the test inspects
+        public_model_list = model_obj.list_public_models(page_size=1)
 
-        log.info(f"Public models listed successfully. Number of models: {len(public_model_list)}")
+        log.debug("Public models listed successfully. Number of models: %s", len(public_model_list))
 
         assert "dataset" in public_model_list[0], "Dataset information not found in the model"
         assert "project" in public_model_list[0], "Project information not found in the model"
 
     @pytest.mark.smoke
-    def test_model_007(self, request, create_test_model, delete_test_model):
+    @pytest.mark.xdist_group("mutating")
+    def test_model_007(self, model_obj, models_data, create_test_model_class):
         """Verify successful upload of training metrics."""
-        log = self.get_logger()
-
         # Retrieve necessary data
-        test_name = request.node.name
-        model_id_key = f"model_id_for_{test_name}"
-        model_id = request.config.cache.get(model_id_key, None)
-        model_metrics_data = TestData().get_models_data()["desired_model_metrics"]
-
-        # Initialize model objects
-        object_manager = ObjectManager(self.client)
-        model_obj = object_manager.get_model()
+        model_id = create_test_model_class
+        model_metrics_data = models_data["desired_model_metrics"]
 
         # Upload model metrics
-        log.info(f"Uploading metrics data for model ID: {model_id}")
+        log.debug("Uploading metrics data for model ID: %s", model_id)
         model_obj.upload_model_metrics(model_id, model_metrics_data)
 
         # Retrieve and verify updated metrics
-        log.info(f"Retrieving updated metrics for model ID: {model_id}")
+        log.debug("Retrieving updated metrics for model ID: %s", model_id)
         updated_model_metrics = model_obj.get_model_metrics(model_id)
 
-        log.info("Verifying if metrics are updated successfully")
+        log.debug("Verifying if metrics are updated successfully")
         assert model_obj.is_metrics_updated(model_metrics_data, updated_model_metrics)
-        log.info("Metrics verification passed successfully.")
+        log.debug("Metrics verification passed successfully.")
 
     @pytest.mark.smoke
-    def test_model_008(self, clear_export_model):
+    @pytest.mark.xdist_group("mutating")
+    def test_model_008(self, model_obj, models_data, clear_export_model):
         """Verify successful export of a model."""
-        log = self.get_logger()
-
         # Retrieve necessary data
-        model_id = TestData().get_models_data()["valid_model_ID"]
-        object_manager = ObjectManager(self.client)
-        model_obj = object_manager.get_model()
-        desired_format = TestData().get_models_data()["desired_model_format"]
+        model_id = models_data["valid_model_ID"]
+        desired_format = models_data["desired_model_format"]
 
         # Export the model
-        log.info(f"Exporting model {model_id} in {desired_format} format")
+        log.debug("Exporting model %s in %s format", model_id, desired_format)
         model_obj.export_model(model_id, format_name=desired_format)
 
         # Check if the model is successfully exported
         export_status = model_obj.is_model_exported(model_id, format_name=desired_format)
-        log.info(f"Model export status: {'Success' if export_status else 'Failure'}")
+        log.debug("Model export status: %s", "Success" if export_status else "Failure")
 
         assert export_status
 
     @pytest.mark.smoke
-    def test_model_009(self):
+    def test_model_009(self, model_obj, models_data):
         """Verify successful retrieval of model storage URL."""
-        log = self.get_logger()
+        model_id = models_data["valid_model_ID"]
 
-        model_id = TestData().get_models_data()["valid_model_ID"]
-
-        log.info(f"Attempting to retrieve the storage URL for model with ID: {model_id}")
-
-        object_manager = ObjectManager(self.client)
-        model_obj = object_manager.get_model()
+        log.debug("Attempting to retrieve the storage URL for model with ID: %s", model_id)
 
         # Get the model storage URL
         link = model_obj.get_model_download_link(model_id)
 
-        log.info(f"Storage URL retrieved successfully. URL: {link}")
+        log.debug("Storage URL retrieved successfully. URL: %s", link)
 
         assert f"{model_id}/best.pt" in link, f"Model ID not found in the storage URL: {link}"
 
     @pytest.mark.smoke
-    def test_model_010(self, request, create_test_model, delete_test_model):
+    @pytest.mark.xdist_group("mutating")
+    def test_model_010(self, model_obj, models_data, create_test_model, delete_test_model):
         """Verify successful upload of a model checkpoint."""
         # Retrieve necessary data
-        test_name = request.node.name
-        model_id_key = f"model_id_for_{test_name}"
-        model_id = request.config.cache.get(model_id_key, None)
-        model_checkpoint_file = TestData().get_models_data()["model_checkpoint_file"]
-
-        log = self.get_logger()
+        model_id = create_test_model
+        model_checkpoint_file = models_data["model_checkpoint_file"]
 
-        log.info(f"Attempting to upload checkpoint for model with ID: {model_id}")
-
-        object_manager = ObjectManager(self.client)
-        model_obj = object_manager.get_model()
+        log.debug("Attempting to upload checkpoint for model with ID: %s", model_id)
 
         # Upload model checkpoint
         response = model_obj.upload_model_checkpoint(model_id, model_checkpoint_file)
 
-        log.info("Verifying if checkpoint uploaded successfully")
+        log.debug("Verifying if checkpoint uploaded successfully")
         assert model_obj.is_checkpoint_uploaded(response), "Model Checkpoint is not uploaded"
-        log.info("Model checkpoint uploaded successfully.")
+        log.debug("Model checkpoint uploaded successfully.")
+
+    @pytest.mark.smoke
+    @pytest.mark.xdist_group("mutating")
+    def test_model_012(self, model_obj, models_data, cache_model_id, delete_test_model):
+        """Verify the create, update and delete lifecycle of a single model, covering tests 003-005 in one pass."""
+        desired_model_data = models_data["desired_model_data"]
+        desired_model_name = desired_model_data["meta"]["name"]
+
+        # Create new model; delete_test_model removes it if a later step fails
+        model_id = model_obj.create_new_model(models_data["new_model_data"])
+        cache_model_id(model_id)
+
+        log.debug("New model created. Model ID: %s", model_id)
+        assert model_id, "Model was not created, no model ID was returned."
+
+        # Update model metadata, reading the name from the update response when the server returns it
+        updated = model_obj.update_model(model_id, desired_model_data)
+        if updated and "meta" in updated:
+            updated_model_name = updated["meta"].get("name")
+        else:
+            updated_model_name = model_obj.get_model_name(model_id)
+
+        log.debug("Updated model name: %s", updated_model_name)
+        assert updated_model_name == desired_model_name, (
+            f"Model name is not updated as expected. Actual: {updated_model_name}, Expected: {desired_model_name}"
+        )
+
+        # Delete the model, so delete_test_model no longer has to
+        deleted = model_obj.delete_model(model_id)
+        if deleted:
+            cache_model_id(None)
+
+        log.debug("Model delete request accepted: %s", deleted)
+        assert deleted, f"Model with ID {model_id} was not deleted."
+
+
+class TestModelExportPolling:
+    """Class for testing the export status polling of the Model feature object without calling the HUB API."""
+
+    @pytest.mark.smoke
+    def test_model_011(self, monkeypatch):
+        """Verify cancelling an export check wakes a backoff wait that is already in progress."""
+        polls = []
+
+        class PendingResponse:
+            """Export status response that never reports the export as ready."""
+
+            headers = {}
+
+            @staticmethod
+            def json():
+                """Returns the body of a pending export status response."""
+                return {"message": "Export not ready"}
+
+        def fake_post(**kwargs):
+            """Records the export status poll and answers that the export is still pending."""
+            polls.append(kwargs)
+            return PendingResponse()
+
+        # Serve the API settings and poll responses locally, so neither test data nor the HUB API is needed
+        monkeypatch.setattr(
+            TestData, "_data", {"api_data": {"host": "http://localhost"}, "auth_data": {"valid_api_key": "DUMMY"}}
+        )
+        monkeypatch.setattr("tests.features.model.requests.post", fake_post)
+
+        # Cancel while the first 60 second backoff wait is running
+        cancel_event = threading.Event()
+        timer = threading.Timer(0.2, cancel_event.set)
+        timer.start()
+        start = time.monotonic()
+        try:
+            exported = Model.is_model_exported("model-id", format_name="onnx", cancel_event=cancel_event)
+        finally:
+            timer.cancel()
+        elapsed = time.monotonic() - start
+
+        log.debug("Export check returned %s after %.2f seconds and %d polls", exported, elapsed, len(polls))
+        assert not exported, "Cancelled export check reported the export as ready"
+        assert len(polls) == 1, f"Expected the check to stop during its first backoff wait, got {len(polls)} polls"
+        assert elapsed < 5, f"Cancelled export check took {elapsed:.1f} seconds to return"
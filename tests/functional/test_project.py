@@ -1,107 +1,92 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+import logging
+
 import pytest
 
-from tests.features.object_manager import ObjectManager
-from tests.test_data.data import TestData
 from tests.utils.base_class import BaseClass
 
+# Named under 'tests' explicitly: pytest imports this module as 'functional.test_project', outside that logger's tree
+log = logging.getLogger("tests.functional.test_project")
+pytestmark = pytest.mark.network
+
 
 class TestProject(BaseClass):
     """Class for testing CRUD operations and retrieval functions of project entities in a smoke test suite."""
 
     @pytest.mark.smoke
-    def test_project_001(self):
+    def test_project_001(self, project_obj, projects_data):
         """Verify successful retrieval of a project by ID."""
-        log = self.get_logger()
-        project_id = TestData().get_projects_data()["valid_project_ID"]
-        log.info(f"Attempting to retrieve project with ID: {project_id}")
+        project_id = projects_data["valid_project_ID"]
+        log.debug("Attempting to retrieve project with ID: %s", project_id)
 
-        object_manager = ObjectManager(self.client)
-        project_obj = object_manager.get_project()
         project = project_obj.get_project_by_id(project_id)
 
-        log.info(f"Project retrieved successfully. Project data: {project.data}")
+        log.debug("Project retrieved successfully. Project data: %s", project.data)
 
         assert "id" in project.data, "ID information not found in the project data"
         assert "meta" in project.data, "Meta information not found in the project data"
 
-    @pytest.mark.smoke
-    def test_project_002(self, request, delete_test_project):
+    @pytest.mark.regression
+    @pytest.mark.xdist_group("mutating")
+    def test_project_002(self, project_obj, projects_data, cache_project_id, delete_test_project):
         """Verify successful creation of a new project."""
-        log = self.get_logger()
-
-        new_project_data = TestData().get_projects_data()["new_project_data"]
-        log.info(f"Attempting to create a new project with data: {new_project_data}")
-
-        object_manager = ObjectManager(self.client)
-        project_obj = object_manager.get_project()
+        new_project_data = projects_data["new_project_data"]
+        log.debug("Attempting to create a new project with data: %s", new_project_data)
 
         # Create new project
         project_id = project_obj.create_new_project(new_project_data)
 
-        log.info(f"New project created successfully. Project ID: {project_id}")
+        log.debug("New project created successfully. Project ID: %s", project_id)
 
-        # Set the project_id in the cache with a key that includes the test name
-        test_name = request.node.name
-        project_id_key = f"project_id_for_test_{test_name}"
-        request.config.cache.set(project_id_key, project_id)
+        # Store the project_id so that delete_test_project removes the project after the test
+        cache_project_id(project_id)
 
-        assert project_obj.is_project_exists(project_id)
+        # The server only assigns an ID to a project it has created
+        assert project_id, "Project was not created, no project ID was returned."
 
-    @pytest.mark.smoke
-    def test_project_003(self, request, create_test_project, delete_test_project):
+    @pytest.mark.regression
+    @pytest.mark.xdist_group("mutating")
+    def test_project_003(self, project_obj, projects_data, create_test_project, delete_test_project):
         """Verify successful update of project metadata."""
-        log = self.get_logger()
-
         # Retrieve necessary data
-        test_name = request.node.name
-        project_id_key = f"project_id_for_{test_name}"
-        project_id = request.config.cache.get(project_id_key, None)
-        desired_project_data = TestData().get_projects_data()["desired_project_data"]
+        project_id = create_test_project
+        desired_project_data = projects_data["desired_project_data"]
         desired_project_name = desired_project_data["meta"]["name"]
 
-        log.info(
-            f"Attempting to update metadata for project with ID {project_id}. Desired project data: "
-            f"{desired_project_name}"
+        log.debug(
+            "Attempting to update metadata for project with ID %s. Desired project data: %s",
+            project_id,
+            desired_project_name,
         )
 
-        object_manager = ObjectManager(self.client)
-        project_obj = object_manager.get_project()
-
         # Update project metadata
         project_obj.update_project(project_id, desired_project_data)
 
-        log.info("Project metadata updated successfully.")
+        log.debug("Project metadata updated successfully.")
 
         # Get the updated project name
         updated_project_name = project_obj.get_project_name(project_id)
 
-        log.info(f"Updated project name: {updated_project_name}")
+        log.debug("Updated project name: %s", updated_project_name)
 
         assert updated_project_name == desired_project_name, (
             f"Project name is not updated as expected. Actual: {updated_project_name}, Expected: {desired_project_name}"
         )
 
-    @pytest.mark.smoke
-    def test_project_004(self, request, create_test_project):
+    @pytest.mark.regression
+    @pytest.mark.xdist_group("mutating")
+    def test_project_004(self, project_obj, create_test_project):
         """Verify successful deletion of a project."""
-        log = self.get_logger()
-
         # Retrieve necessary data
-        test_name = request.node.name
-        project_id_key = f"project_id_for_{test_name}"
-        project_id = request.config.cache.get(project_id_key, None)
-
-        log.info(f"Attempting to delete project with ID: {project_id}")
+        project_id = create_test_project
 
-        object_manager = ObjectManager(self.client)
-        project_obj = object_manager.get_project()
+        log.debug("Attempting to delete project with ID: %s", project_id)
 
         # Delete the project
         project_obj.delete_project(project_id)
 
-        log.info("Project deleted successfully.")
+        log.debug("Project deleted successfully.")
 
         # Verify if the project no longer exists
         assert not project_obj.is_project_exists(project_id), (
@@ -109,19 +94,60 @@ class TestProject(BaseClass):
         )
 
     @pytest.mark.smoke
-    def test_project_005(self):
+    def test_project_005(self, project_obj):
         """Verify successful listing of public projects."""
-        log = self.get_logger()
-
-        log.info("Attempting to list public projects.")
-
-        object_manager = ObjectManager(self.client)
-        project_obj = object_manager.get_project()
+        log.debug("Attempting to list public projects.")
 
-        # List public projects
-        public_project_list = project_obj.list_public_projects()
+        # List public projects, fetching only the one entry the test inspects
+        public_project_list = project_obj.list_public_projects(page_size=1)
 
-        log.info(f"Public projects listed successfully. First dataset information: {public_project_list[0]}")
+        log.debug("Public projects listed successfully. First dataset information: %s", public_project_list[0])
 
         assert "id" in public_project_list[0], "ID information not found in the project data"
         assert "meta" in public_project_list[0], "Meta information not found in the project data"
+
+    @pytest.mark.smoke
+    def test_project_006(self, projects_data):
+        """Verify the HEAD existence check agrees with a full GET for a known project and rejects a missing one."""
+        project_id = projects_data["valid_project_ID"]
+
+        head_result = self.client.project_exists(project_id)
+        get_result = bool(self.client.project(project_id).data)
+        log.debug("Project %s: HEAD says %s, GET says %s", project_id, head_result, get_result)
+        assert head_result == get_result, f"HEAD and GET disagree on whether project {project_id} exists"
+
+        # A missing project is a normal negative answer to the HEAD check, not an error
+        assert not self.client.project_exists("nonexistent-id"), "HEAD check reports a missing project as existing"
+
+    @pytest.mark.smoke
+    @pytest.mark.xdist_group("mutating")
+    def test_project_007(self, project_obj, projects_data, cache_project_id, delete_test_project):
+        """Verify the create, update and delete lifecycle of a single project, covering tests 002-004 in one pass."""
+        desired_project_data = projects_data["desired_project_data"]
+        desired_project_name = desired_project_data["meta"]["name"]
+        # Create new project; delete_test_project removes it if a later step fails
+        project_id = project_obj.create_new_project(projects_data["new_project_data"])
+        cache_project_id(project_id)
+
+        log.debug("New project created. Project ID: %s", project_id)
+        assert project_id, "Project was not created, no project ID was returned."
+
+        # Update project metadata
+        project_obj.update_project(project_id, desired_project_data)
+        updated_project_name = project_obj.get_project_name(project_id)
+
+        log.debug("Updated project name: %s", updated_project_name)
+        assert updated_project_name == desired_project_name, (
+            f"Project name is not updated as expected. Actual: {updated_project_name}, Expected: {desired_project_name}"
+        )
+
+        # Delete the project, so delete_test_project no longer has to
+        deleted = project_obj.delete_project(project_id)
+        if deleted:
+            cache_project_id(None)
+
+        log.debug("Project delete request accepted: %s", deleted)
+        assert deleted, f"Project with ID {project_id} was not deleted."
+        assert not project_obj.is_project_exists(project_id), (
+            f"Project with ID {project_id} still exists after deletion."
+        )
@@ -1,8 +1,9 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
-import inspect
+import functools
 import logging
 import os
+import threading
 import time
 
 import pytest
@@ -10,26 +11,58 @@ import pytest
 from hub_sdk import HUBClient
 
 
+class RateLimiter:
+    """
+    Token-bucket rate limiter used to pace requests to the HUB API.
+
+    Attributes:
+        rate (float): Tokens added per second, i.e. the sustained requests-per-second ceiling.
+        capacity (float): Maximum number of stored tokens, i.e. the largest burst allowed after idle time.
+    """
+
+    def __init__(self, rate=1.0, capacity=1.0):
+        """Initializes a full bucket with the given refill rate and capacity."""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Takes one token, sleeping only as long as it takes for that token to become available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
 @pytest.mark.usefixtures("setup")
 class BaseClass:
     """Provides base functionality and logging capabilities for classes utilizing the HUBClient SDK."""
 
+    __slots__ = ()
+
     client: HUBClient
+    # The request budget is shared by all pytest-xdist workers, so each worker gets an equal slice of it
+    rate_limiter = RateLimiter(rate=1.0 / int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 1)))
 
     @classmethod
-    def get_logger(cls):
+    @functools.lru_cache(maxsize=None)
+    def logger(cls):
         """
-        This method creates and configures a custom logger for the calling function or method. It uses the calling
-        function's name as the logger name and logs messages to a file located at './reports/logfile.log'.
-
-        Example Usage:
-            logger = self.get_logger()
-            logger.debug("Debug message")
-            logger.info("Information message")
-            logger.error("Error message")
+        Returns the logger for this class, configured with the report file handler on first use only.
+
+        Repeated calls return the same logger without attaching another file handler.
         """
-        logger_name = inspect.stack()[1][3]
-        logger = logging.getLogger(logger_name)
+        return cls._configure_logger(logging.getLogger(cls.__name__))
+
+    @staticmethod
+    def _configure_logger(logger):
+        """Attaches the './reports/logfile.log' file handler to a logger and sets its level to DEBUG."""
         if not os.path.exists("./reports"):
             os.makedirs("./reports")
         file_handler = logging.FileHandler("./reports/logfile.log")
@@ -42,6 +75,6 @@ class BaseClass:
         return logger
 
     @classmethod
-    def delay(cls, seconds=1):
-        """Pauses program execution for a given number of seconds."""
-        time.sleep(seconds)
+    def delay(cls):
+        """Waits for a request slot from the shared rate limiter, returning immediately if one is available."""
+        cls.rate_limiter.acquire()